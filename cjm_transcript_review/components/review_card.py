@@ -85,6 +85,40 @@ class AssembledSegment:
         return self.vad_chunk.end_time
 
 # %% ../../nbs/components/review_card.ipynb #review-card-render
+# Card class strings
+_META_FOCUSED_CLS = combine_classes(font_size.xs, font_family.mono, opacity(60))
+_META_CONTEXT_CLS = combine_classes(font_size.xs, font_family.mono, opacity(40))
+_TEXT_FOCUSED_CLS = combine_classes(font_size.base, leading.relaxed, text_dui.base_content, m.b(3))
+_TEXT_CONTEXT_CLS = combine_classes(font_size.base, leading.relaxed, text_tiers.secondary, m.b(3))
+_DURATION_BADGE_CLS = combine_classes(badge, badge_styles.ghost, font_size.xs, font_family.mono)
+_PLAYING_INDICATOR_CLS = combine_classes(loading, loading_styles.bars, loading_sizes.xs, text_dui.secondary)
+_PLAY_BTN_CLS = combine_classes(btn, btn_sizes.xs, btn_colors.primary, btn_modifiers.circle)
+_PLAY_BTN_DISABLED_CLS = combine_classes(btn, btn_sizes.xs, btn_behaviors.disabled, btn_modifiers.circle)
+_BOUNDARY_ABOVE_CLS = combine_classes(border.t(4), border_dui.neutral)
+_BOUNDARY_BELOW_CLS = combine_classes(border.b(4), border_dui.neutral)
+_INDEX_LABEL_CLS = combine_classes(
+    font_size.xs, font_family.mono, font_weight.bold,
+    opacity(50)
+)
+_INDEX_ROW_CLS = combine_classes(flex_display, flex_direction.row, gap(1), items.center)
+_LEFT_COLUMN_CLS = combine_classes(w(12), shrink(0), flex_display, flex_direction.col, gap(2), items.center)
+_SPACER_CLS = str(grow())
+_META_ROW_CLS = combine_classes(
+    flex_display, items.center, gap(3),
+    font_size.xs
+)
+_CENTER_COLUMN_CLS = combine_classes(grow(), min_h(6))
+_CARD_BODY_CLS = combine_classes(
+    card_body, p(4),
+    flex_display, flex_direction.row, gap(3), items.start
+)
+_CARD_CLS = combine_classes(
+    panels.content_card, "review-card",
+    position.relative,
+    w.full,
+    transition.all, duration(150),
+)
+
 def render_review_card(
     assembled:AssembledSegment,  # Assembled segment with text and timing
     card_role:CardRole,  # Role of this card in viewport ("focused" or "context")
@@ -98,19 +132,19 @@ def render_review_card(
     chunk = assembled.vad_chunk
     
     # Text styling based on card role
-    text_cls = text_dui.base_content if is_focused else text_tiers.secondary
-    meta_opacity = opacity(60) if is_focused else opacity(40)
+    text_cls = _TEXT_FOCUSED_CLS if is_focused else _TEXT_CONTEXT_CLS
+    meta_cls = _META_FOCUSED_CLS if is_focused else _META_CONTEXT_CLS
     
     # Time range display
     time_range = Span(
         f"{format_time(chunk.start_time)} → {format_time(chunk.end_time)}",
-        cls=combine_classes(font_size.xs, font_family.mono, meta_opacity)
+        cls=meta_cls
     )
     
     # Duration badge
     duration_badge = Span(
         format_duration(chunk.start_time, chunk.end_time),
-        cls=combine_classes(badge, badge_styles.ghost, font_size.xs, font_family.mono)
+        cls=_DURATION_BADGE_CLS
     )
     
     # Source info
@@ -121,12 +155,12 @@ def render_review_card(
             seg.start_char,
             seg.end_char
         ),
-        cls=combine_classes(font_size.xs, font_family.mono, meta_opacity)
+        cls=meta_cls
     )
     
     # Playing indicator — inline next to index, hidden by default
     playing_indicator = Div(
-        Span(cls=combine_classes(loading, loading_styles.bars, loading_sizes.xs, text_dui.secondary)),
+        Span(cls=_PLAYING_INDICATOR_CLS),
         cls="review-playing-indicator",
         style="visibility:hidden;",
     )
@@ -138,14 +172,14 @@ def render_review_card(
         play_btn = Button(
             play_icon,
             type="button",
-            cls=combine_classes(btn, btn_sizes.xs, btn_colors.primary, btn_modifiers.circle),
+            cls=_PLAY_BTN_CLS,
             onclick="if(window.replayReviewSegment) window.replayReviewSegment();",
         )
     else:
         play_btn = Button(
             play_icon,
             type="button",
-            cls=combine_classes(btn, btn_sizes.xs, btn_behaviors.disabled, btn_modifiers.circle),
+            cls=_PLAY_BTN_DISABLED_CLS,
             tabindex="-1",
         )
     
@@ -153,9 +187,9 @@ def render_review_card(
     boundary_cls = ""
     if is_context:
         if has_boundary_above:
-            boundary_cls = combine_classes(border.t(4), border_dui.neutral)
+            boundary_cls = _BOUNDARY_ABOVE_CLS
         if has_boundary_below:
-            boundary_cls = combine_classes(boundary_cls, border.b(4), border_dui.neutral)
+            boundary_cls = combine_classes(boundary_cls, _BOUNDARY_BELOW_CLS)
     
     return Div(
         Div(
@@ -165,17 +199,14 @@ def render_review_card(
                 Div(
                     Span(
                         f"#{seg.index + 1}",
-                        cls=combine_classes(
-                            font_size.xs, font_family.mono, font_weight.bold,
-                            opacity(50)
-                        )
+                        cls=_INDEX_LABEL_CLS
                     ),
                     playing_indicator,
-                    cls=combine_classes(flex_display, flex_direction.row, gap(1), items.center)
+                    cls=_INDEX_ROW_CLS
                 ),
                 # Play button
                 play_btn,
-                cls=combine_classes(w(12), shrink(0), flex_display, flex_direction.col, gap(2), items.center)
+                cls=_LEFT_COLUMN_CLS
             ),
             
             # Center: Main content
@@ -183,37 +214,25 @@ def render_review_card(
                 # Text content
                 P(
                     seg.text,
-                    cls=combine_classes(font_size.base, leading.relaxed, text_cls, m.b(3))
+                    cls=text_cls
                 ),
                 
                 # Footer with timing and source
                 Div(
                     time_range,
                     duration_badge,
-                    Div(cls=str(grow())),
+                    Div(cls=_SPACER_CLS),
                     source_info,
-                    cls=combine_classes(
-                        flex_display, items.center, gap(3),
-                        font_size.xs
-                    )
+                    cls=_META_ROW_CLS
                 ),
-                cls=combine_classes(grow(), min_h(6))
+                cls=_CENTER_COLUMN_CLS
             ),
             
-            cls=combine_classes(
-                card_body, p(4),
-                flex_display, flex_direction.row, gap(3), items.start
-            )
+            cls=_CARD_BODY_CLS
         ),
         
         id=ReviewHtmlIds.review_card(seg.index),
-        cls=combine_classes(
-            panels.content_card, "review-card",
-            position.relative,
-            w.full,
-            transition.all, duration(150),
-            boundary_cls,
-        ),
+        cls=combine_classes(_CARD_CLS, boundary_cls),
         data_segment_index=str(seg.index),
         data_audio_file_index=str(chunk.audio_file_index),
         data_start_time=str(chunk.start_time),
@@ -8,6 +8,8 @@ __all__ = ['DEBUG_REVIEW_RENDER', 'render_review_toolbar', 'render_review_stats'
 
 # %% ../../nbs/components/step_renderer.ipynb #review-sr-imports
 from typing import Any, List, Optional
+import math
+from operator import attrgetter
 
 from fasthtml.common import Div, Span, Input, Label
 
@@ -125,14 +127,17 @@ def render_review_toolbar(
     )
 
 # %% ../../nbs/components/step_renderer.ipynb #review-sr-stats
+# Shared by the stats and source-position spans
+_SECONDARY_TEXT_CLS = combine_classes(font_size.sm, text_tiers.secondary)
+
 def render_review_stats(
     assembled:List[AssembledSegment],  # Assembled segments
     oob:bool=False,  # Whether to render as OOB swap
 ) -> Any:  # Statistics component
     """Render review statistics."""
     total = len(assembled)
-    total_dur = sum(a.vad_chunk.duration for a in assembled) if assembled else 0.0
     chunks = [a.vad_chunk for a in assembled]
+    total_dur = math.fsum(map(attrgetter("duration"), chunks))
     file_count = get_audio_file_count(chunks)
 
     stats_text = f"{total} segments \u00b7 {total_dur:.1f}s total"
@@ -142,7 +147,7 @@ def render_review_stats(
     return Div(
         Span(
             stats_text,
-            cls=combine_classes(font_size.sm, text_tiers.secondary)
+            cls=_SECONDARY_TEXT_CLS
         ),
         id=ReviewHtmlIds.REVIEW_STATS,
         hx_swap_oob="true" if oob else None
@@ -167,7 +172,7 @@ def render_review_source_position(
     return Span(
         content,
         id=ReviewHtmlIds.SOURCE_POSITION,
-        cls=combine_classes(font_size.sm, text_tiers.secondary),
+        cls=_SECONDARY_TEXT_CLS,
         hx_swap_oob="true" if oob else None,
     )
 
@@ -10,6 +10,7 @@ __all__ = ['ReviewHtmlIds']
 
 class ReviewHtmlIds:
     """HTML ID constants for Phase 3: Review & Commit."""
+    __slots__ = ()  # Namespace only; never instantiated
 
     @staticmethod
     def as_selector(
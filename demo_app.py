@@ -6,15 +6,47 @@ keyboard navigation, and commit to graph. Works standalone for testing.
 Run with: python demo_app.py
 """
 
-from typing import List, Dict, Any, Callable
+from typing import List, Dict, Any, Callable, Optional, Tuple
+from collections import OrderedDict
 from pathlib import Path
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import attrgetter
+import asyncio
+import copy
+import io
+import math
+import os
+import queue
 import tempfile
+import threading
+import time
+import sqlite3
+import stat
 import json
 
+import anyio
 from fasthtml.common import (
-    fast_app, Div, P, Span, Button,
-    FileResponse,
+    fast_app, Div, P, Span, Button, Title, Link,
+    FileResponse, HTMLResponse, Response, to_xml, Route,
 )
+from fasthtml.core import respond
+from starlette.datastructures import Headers, QueryParams
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to stdlib json throughout the demo
+    orjson = None
+
+# Bytes-or-str JSON decoder: orjson when installed, stdlib json otherwise
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(obj:Any) -> str:  # JSON text
+    """Encode to JSON text, with orjson when installed (str keys coerced like stdlib json)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
 
 from cjm_fasthtml_app_core.core.routing import APIRouter
 
@@ -43,7 +75,6 @@ from cjm_fasthtml_tailwind.core.base import combine_classes
 
 # App core
 from cjm_fasthtml_app_core.core.routing import register_routes
-from cjm_fasthtml_app_core.core.htmx import handle_htmx_request
 from cjm_fasthtml_app_core.components.step_header_band import render_step_header_band
 
 # Design system recipes (V10 panel / chrome variants)
@@ -102,6 +133,7 @@ from cjm_transcript_review.routes.core import (
 
 class DemoHtmlIds:
     """HTML IDs for demo app layout."""
+    __slots__ = ()  # Namespace only; never instantiated
     CONTAINER = "review-demo-container"
     COLUMN = "review-demo-column"
     COLUMN_HEADER = "review-demo-column-header"
@@ -114,6 +146,234 @@ class DemoHtmlIds:
     COMMIT_ALERT_CONTAINER = "commit-alert-container"
 
 
+# Chrome slots filled by the init response, resolved once for the hot path
+_OOB_SLOT_IDS = (
+    DemoHtmlIds.SETTINGS_TRIGGER,
+    DemoHtmlIds.SHARED_TOOLBAR,
+    DemoHtmlIds.SETTINGS_MODAL,
+    DemoHtmlIds.SHARED_FOOTER,
+)
+_MINI_STATS_ID = DemoHtmlIds.MINI_STATS
+
+
+# =============================================================================
+# Demo Layout Classes
+# =============================================================================
+
+_P2 = str(p(2))
+_ML2 = str(m.l(2))
+_COLUMN_TITLE_CLS = combine_classes(
+    font_size.sm, font_weight.bold,
+    uppercase, tracking.wide,
+    text_tiers.muted
+)
+_BADGE_MINI_CLS = combine_classes(badge, badge_styles.ghost, badge_sizes.sm)
+_COLUMN_HEADER_CLS = combine_classes(
+    flex_display, justify.between, items.center,
+    chrome.column_header,
+)
+_COLUMN_CONTENT_CLS = combine_classes(grow(), overflow.hidden, flex_display, flex_direction.col, p(4))
+_COLUMN_CLS = combine_classes(
+    w.full, max_w._4xl, m.x.auto,
+    min_h(0),
+    flex_display, flex_direction.col,
+    panels.structural_container,
+    overflow.hidden,
+    transition.all, duration._200,
+    ring(1), "ring-primary",
+)
+_PLACEHOLDER_TEXT_CLS = combine_classes(font_size.sm, text_tiers.muted)
+_FOOTER_CLS = combine_classes(
+    chrome.column_footer,
+    flex_display, justify.center, items.center,
+)
+_COMMIT_BUTTON_CLS = combine_classes(btn, btn_colors.success, btn_sizes.sm, flex_display, items.center)
+_CONTENT_AREA_CLS = combine_classes(
+    grow(),
+    min_h(0),
+    flex_display,
+    flex_direction.col,
+    overflow.hidden,
+    p(1),
+)
+_CONTAINER_CLS = combine_classes(
+    container, max_w._5xl, m.x.auto,
+    h.full,
+    flex_display, flex_direction.col,
+    p(4), p.x(2), p.b(0)
+)
+
+
+# =============================================================================
+# State Store
+# =============================================================================
+
+# Applied to every connection the store opens. journal_mode=WAL persists in the
+# database file; the remaining pragmas are per-connection settings.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;"
+    " PRAGMA synchronous=NORMAL;"
+    " PRAGMA busy_timeout=5000;"
+    " PRAGMA temp_store=MEMORY;"
+    " PRAGMA cache_size=-20000;"
+    " PRAGMA mmap_size=268435456;"
+)
+
+
+class WALWorkflowStateStore(SQLiteWorkflowStateStore):
+    """SQLite workflow state store that opens every connection in WAL mode."""
+
+    def _connect(
+        self,
+        read_only:bool=False,  # Open the database with mode=ro
+        **kwargs,  # Extra keyword arguments for sqlite3.connect
+    ) -> sqlite3.Connection:  # Connection with pragmas applied
+        """Open a connection to the state database and apply the tuning pragmas."""
+        if read_only:
+            conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True, **kwargs)
+        else:
+            conn = sqlite3.connect(self.db_path, **kwargs)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(SQLITE_PRAGMAS)
+        return conn
+
+    @contextmanager
+    def _get_connection(self):
+        """Get a tuned database connection with commit-on-success and guaranteed close."""
+        conn = self._connect()
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+
+class PooledStateStore(WALWorkflowStateStore):
+    """WAL state store with a pool of read-only connections and a single serialized writer."""
+
+    def __init__(
+        self,
+        db_path:Path,  # Path to SQLite database file
+        read_pool_size:Optional[int]=None,  # Number of reader connections (None = CPU count)
+    ):
+        """Open the writer, initialize the schema through it, then open the reader pool."""
+        # The writer must exist before the base __init__ runs _init_db through it
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_lock = threading.RLock()
+        self._tx_depth = 0  # Nesting depth of transaction() on the writer
+        self._tx_owner = None  # Thread ident holding the open transaction
+        # Autocommit mode so BEGIN IMMEDIATE / COMMIT are issued explicitly
+        self._write_conn = self._connect(check_same_thread=False, isolation_level=None)
+        super().__init__(db_path)
+
+        # Readers are opened mode=ro, so the database file must already exist
+        pool_size = read_pool_size or os.cpu_count() or 1
+        self._read_pool = queue.Queue(maxsize=pool_size)
+        for _ in range(pool_size):
+            self._read_pool.put(self._connect(read_only=True, check_same_thread=False))
+
+    @contextmanager
+    def transaction(self):
+        """Run the enclosed reads and writes as one BEGIN IMMEDIATE transaction on the writer."""
+        with self._write_lock:
+            conn = self._write_conn
+            outermost = self._tx_depth == 0
+            if outermost:
+                conn.execute("BEGIN IMMEDIATE")
+                self._tx_owner = threading.get_ident()
+            self._tx_depth += 1
+            try:
+                yield conn
+                if outermost:
+                    conn.execute("COMMIT")
+            except BaseException:
+                if outermost:
+                    conn.execute("ROLLBACK")
+                raise
+            finally:
+                self._tx_depth -= 1
+                if outermost:
+                    self._tx_owner = None
+
+    def _get_connection(self):
+        """Get the writer connection, joining the open transaction if there is one."""
+        return self.transaction()
+
+    @contextmanager
+    def _get_read_connection(self):
+        """Borrow a reader connection from the pool and return it when done."""
+        conn = self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+
+    def _read_state(
+        self,
+        conn:sqlite3.Connection,  # Connection to read through
+        key:str,  # Composite "flow_id:session_id" key
+    ) -> Dict[str, Any]:  # Full session state dictionary
+        """Read and decode the state blob for a session key."""
+        row = conn.execute(
+            "SELECT state_json FROM workflow_state WHERE flow_session_key = ?",
+            (key,)
+        ).fetchone()
+        if row and row["state_json"]:
+            return _json_loads(row["state_json"])
+        return {}
+
+    def get_state(
+        self,
+        flow_id:str,  # Workflow identifier
+        session_id:str,  # Session identifier string
+    ) -> Dict[str, Any]:  # Full session state dictionary
+        """Get the full state dictionary for a session through the reader pool."""
+        key = self._make_key(flow_id, session_id)
+        # Inside transaction() read through the writer so uncommitted writes are visible
+        if self._tx_owner == threading.get_ident():
+            return self._read_state(self._write_conn, key)
+        with self._get_read_connection() as conn:
+            return self._read_state(conn, key)
+
+    def update_state(
+        self,
+        flow_id:str,  # Workflow identifier
+        session_id:str,  # Session identifier string
+        updates:Dict[str, Any],  # Top-level state keys to merge in
+    ) -> None:
+        """Merge updates into the session state, reading and writing under the writer lock."""
+        key = self._make_key(flow_id, session_id)
+        with self._get_connection() as conn:
+            current_state = self._read_state(conn, key)
+            current_state.update(updates)
+            conn.execute("""
+                INSERT INTO workflow_state (flow_session_key, state_json)
+                VALUES (?, ?)
+                ON CONFLICT(flow_session_key) DO UPDATE SET
+                    state_json = excluded.state_json,
+                    updated_at = CURRENT_TIMESTAMP
+            """, (key, _json_dumps(current_state)))
+
+    def set_state_value(
+        self,
+        flow_id:str,  # Workflow identifier
+        session_id:str,  # Session identifier string
+        state_key:str,  # Top-level state key to replace
+        value:Any,  # New value, stored verbatim
+    ) -> None:
+        """Replace one top-level state key in place with SQLite's json_set, without decoding the blob in Python."""
+        key = self._make_key(flow_id, session_id)
+        with self._get_connection() as conn:
+            conn.execute("""
+                INSERT INTO workflow_state (flow_session_key, state_json)
+                VALUES (?1, json_object(?2, json(?3)))
+                ON CONFLICT(flow_session_key) DO UPDATE SET
+                    state_json = json_set(coalesce(nullif(state_json, ''), '{}'), '$."' || ?2 || '"', json(?3)),
+                    updated_at = CURRENT_TIMESTAMP
+            """, (key, state_key, _json_dumps(value)))
+
+
 # =============================================================================
 # Test Data from JSON
 # =============================================================================
@@ -124,11 +384,23 @@ TEST_STATE_JSON = Path(__file__).parent / "test_files" / "state_json.json"
 
 TEST_AUDIO_PATH = Path(__file__).parent / "test_files" / "short_test_audio.mp3"
 
+# Only files under this directory are served by the audio route
+AUDIO_MEDIA_ROOT = TEST_AUDIO_PATH.parent.resolve()
 
-def load_test_state() -> Dict[str, Any]:
+# Cache policy for served audio. FileResponse already advertises byte ranges,
+# so browser seeks become range GETs instead of whole-file reads. URLs carrying
+# the file's current version (&v=<mtime_ns>) name fixed content and may be reused
+# without revalidating; anything else is revalidated through the ETag.
+AUDIO_CACHE_IMMUTABLE = "public, max-age=31536000, immutable"
+AUDIO_CACHE_REVALIDATE = "no-cache"
+
+
+# Built on the first init rather than at import, so the module imports without
+# test_files/; handlers mutate the copies returned by load_test_state().
+@lru_cache(maxsize=1)
+def _build_test_state() -> Dict[str, Any]:
     """Load test state from JSON and duplicate data for multi-source testing."""
-    with open(TEST_STATE_JSON, "r") as f:
-        state = json.load(f)
+    state = _json_loads(TEST_STATE_JSON.read_bytes())
 
     step_states = state.get("step_states", {})
 
@@ -164,53 +436,271 @@ def load_test_state() -> Dict[str, Any]:
     return state
 
 
+def load_test_state() -> Dict[str, Any]:
+    """Return a fresh copy of the prepared test step_states."""
+    return copy.deepcopy(_build_test_state().get("step_states", {}))
+
+
+def _resolve_audio_path(
+    path:Optional[str],  # Requested audio file path
+) -> Optional[Path]:  # Resolved path, or None if outside the media root
+    """Resolve a requested audio path, rejecting anything outside AUDIO_MEDIA_ROOT."""
+    if not path:
+        return None
+    try:
+        resolved = Path(path).resolve()
+    except (OSError, ValueError):  # e.g. an embedded null byte from ?path=%00
+        return None
+    return resolved if resolved.is_relative_to(AUDIO_MEDIA_ROOT) else None
+
+
+# =============================================================================
+# Audio Endpoint
+# =============================================================================
+
+# Route path for audio playback requests
+AUDIO_SRC_PATH = "/audio/audio_src"
+
+
+def _audio_etag(
+    stat_result:os.stat_result,  # Stat of the audio file
+) -> str:  # Quoted strong ETag
+    """Build an ETag from the file's modification time and size."""
+    return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+def _audio_version(
+    stat_result:os.stat_result,  # Stat of the audio file
+) -> str:  # Version token for the file's current content
+    """Build the URL version token from the file's modification time."""
+    return f"{stat_result.st_mtime_ns:x}"
+
+
+def _audio_src_url(
+    audio_src:str,  # Audio source route
+    media_path:str,  # Media file path
+) -> str:  # Playback URL, versioned when the file can be stat'ed
+    """Build an audio URL whose v= parameter changes whenever the file does."""
+    url = f"{audio_src}?path={media_path}"
+    try:
+        return f"{url}&v={_audio_version(os.stat(media_path))}"
+    except (OSError, ValueError):
+        return url
+
+
+def _etag_matches(
+    if_none_match:Optional[str],  # If-None-Match request header value
+    etag:str,  # Current ETag of the resource
+) -> bool:  # True if the client's cached copy is current
+    """Check an If-None-Match header against an ETag using weak comparison."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+class AudioFileResponse(FileResponse):
+    """FileResponse that reads audio in larger chunks when the server can't pathsend."""
+
+    # uvicorn doesn't offer http.response.pathsend, so bodies are streamed from a
+    # worker thread; bigger reads mean fewer thread hops and send() calls per file
+    chunk_size = 1024 * 1024
+
+
+# Resolved-and-validated audio lookups, reused for a few seconds so replaying the
+# same segments doesn't repeat the realpath walk and stat on every request.
+# Only touched from the event loop thread, so no lock is needed.
+AUDIO_LOOKUP_TTL = 5.0  # Seconds a lookup stays valid
+AUDIO_LOOKUP_CACHE_SIZE = 1024
+
+_audio_lookup_cache: "OrderedDict[str, Tuple[float, Optional[Tuple[Path, os.stat_result]]]]" = OrderedDict()
+
+
+def _lookup_audio_file(
+    path:Optional[str],  # Requested audio file path
+) -> Optional[Tuple[Path, os.stat_result]]:  # Resolved path and stat, or None if not servable
+    """Resolve and stat a requested audio path, rejecting anything that isn't a regular file under AUDIO_MEDIA_ROOT."""
+    audio_path = _resolve_audio_path(path)
+    if audio_path is None:
+        return None
+    try:
+        stat_result = audio_path.stat()
+    except OSError:
+        return None
+    return (audio_path, stat_result) if stat.S_ISREG(stat_result.st_mode) else None
+
+
+async def _lookup_audio_file_cached(
+    path:Optional[str],  # Requested audio file path
+) -> Optional[Tuple[Path, os.stat_result]]:  # Resolved path and stat, or None if not servable
+    """Return a recent lookup for the path, running the filesystem calls in a worker thread on a miss."""
+    if not path:
+        return None
+    now = time.monotonic()
+    entry = _audio_lookup_cache.get(path)
+    if entry is not None and entry[0] > now:
+        _audio_lookup_cache.move_to_end(path)
+        return entry[1]
+
+    found = await anyio.to_thread.run_sync(_lookup_audio_file, path)
+    _audio_lookup_cache[path] = (now + AUDIO_LOOKUP_TTL, found)
+    _audio_lookup_cache.move_to_end(path)
+    if len(_audio_lookup_cache) > AUDIO_LOOKUP_CACHE_SIZE:
+        _audio_lookup_cache.popitem(last=False)
+    return found
+
+
+class AudioSrcEndpoint:
+    """Pure ASGI endpoint serving audio files for Web Audio API playback."""
+
+    async def __call__(self, scope, receive, send):
+        """Serve the requested file straight from the ASGI scope, without a Request object."""
+        params = QueryParams(scope["query_string"])
+        found = await _lookup_audio_file_cached(params.get("path"))
+        if found is not None:
+            audio_path, stat_result = found
+            current = params.get("v") == _audio_version(stat_result)
+            headers = {
+                "Cache-Control": AUDIO_CACHE_IMMUTABLE if current else AUDIO_CACHE_REVALIDATE,
+                "ETag": _audio_etag(stat_result),
+            }
+            if _etag_matches(Headers(scope=scope).get("if-none-match"), headers["ETag"]):
+                response = Response(status_code=304, headers=headers)
+            else:
+                # Passing the stat result skips FileResponse's own stat; it
+                # derives Last-Modified from it and keeps our ETag
+                response = AudioFileResponse(
+                    audio_path, media_type="audio/mpeg",
+                    headers=headers, stat_result=stat_result,
+                )
+        else:
+            response = Response(status_code=404, content="Audio file not found")
+        await response(scope, receive, send)
+
+
+# =============================================================================
+# LRU Cache Helper
+# =============================================================================
+
+def _lru_get(
+    cache:OrderedDict,  # Cache storage, least recently used first
+    lock:threading.Lock,  # Lock guarding the cache
+    maxsize:int,  # Maximum number of entries kept
+    key:Any,  # Hashable cache key
+    build:Callable[[], Any],  # Computes the value on a miss (called without the lock held)
+) -> Any:  # Cached or freshly built value
+    """Look up a key in a thread-safe LRU cache, building and storing the value on a miss."""
+    with lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+            return value
+
+    value = build()
+    with lock:
+        cache[key] = value
+        if len(cache) > maxsize:
+            cache.popitem(last=False)
+    return value
+
+
 # =============================================================================
 # Demo Init Handler
 # =============================================================================
 
+# The OOB wrappers only vary by their inner content, so they are emitted from
+# static string templates rather than rebuilt as Div/Span components per request.
+_OOB_TMPL = '<div id="{id}" hx-swap-oob="innerHTML">{inner}</div>'
+_MINI_STATS_TMPL = (
+    f'<span id="{_MINI_STATS_ID}" class="{_BADGE_MINI_CLS}" hx-swap-oob="true">'
+    '{total} segments \u00b7 {total_dur:.1f}s</span>'
+)
+
+def _render_init_body(
+    slot_html:Tuple[str, ...],  # Serialized inner HTML per slot, in _OOB_SLOT_IDS order
+    total:int,  # Number of assembled segments
+    total_dur:float,  # Summed VAD duration of the assembled segments
+    content_html:str="",  # Serialized main content written ahead of the swaps
+) -> str:  # Main content followed by all chrome OOB swaps
+    """Serialize the init response body and its chrome OOB swaps in a single string-write pass."""
+    buf = io.StringIO()
+    buf.write(content_html)
+    for slot_id, inner in zip(_OOB_SLOT_IDS, slot_html):
+        buf.write(_OOB_TMPL.format(id=slot_id, inner=inner))
+
+    # Mini-stats badge
+    buf.write(_MINI_STATS_TMPL.format(total=total, total_dur=total_dur))
+
+    return buf.getvalue()
+
+
+def _review_initialized(
+    workflow_state:Dict[str, Any],  # Full session state dictionary
+) -> bool:  # True once the session's review state has been seeded
+    """Check whether a session already holds seeded review state."""
+    return workflow_state.get("step_states", {}).get("review", {}).get("_initialized") is True
+
+
 def create_demo_init_handler(
-    state_store: SQLiteWorkflowStateStore,
+    state_store: PooledStateStore,
     workflow_id: str,
     urls: ReviewUrls,
 ):
     """Create init handler that loads test data from JSON and renders the step."""
 
+    # The toolbar only varies with the audio settings; urls are fixed per app
+    @lru_cache(maxsize=64)
+    def toolbar_html(playback_speed:float, auto_navigate:bool) -> str:
+        """Serialize the review toolbar for one combination of audio settings."""
+        return to_xml(render_review_toolbar(
+            playback_speed=playback_speed,
+            auto_navigate=auto_navigate,
+            urls=urls,
+        ))
+
     def init_handler(request, sess):
         """Initialize review with test data from JSON file."""
         session_id = get_session_id(sess)
 
-        # Load test state from JSON
-        test_state = load_test_state()
-
-        # Initialize workflow state with test data
+        # Repeat inits only read, so the flag is checked through the reader pool
+        # and the writer transaction is only taken to seed a session's first visit
         workflow_state = state_store.get_state(workflow_id, session_id)
-
-        # Copy step_states from test data
-        workflow_state["step_states"] = test_state.get("step_states", {})
-
-        # Set up review state with defaults (reset focused_index to 0 for demo)
-        if "review" not in workflow_state["step_states"]:
-            workflow_state["step_states"]["review"] = {}
-
-        workflow_state["step_states"]["review"]["focused_index"] = 0
-        workflow_state["step_states"]["review"]["visible_count"] = DEFAULT_VISIBLE_COUNT
-        workflow_state["step_states"]["review"]["is_auto_mode"] = False
-        workflow_state["step_states"]["review"]["card_width"] = DEFAULT_CARD_WIDTH
-        workflow_state["step_states"]["review"]["playback_speed"] = 1.0
-        workflow_state["step_states"]["review"]["auto_navigate"] = False
-
-        state_store.update_state(workflow_id, session_id, workflow_state)
+        if not _review_initialized(workflow_state):
+            with state_store.transaction():
+                # Re-checked under the writer lock in case a concurrent init seeded it
+                workflow_state = state_store.get_state(workflow_id, session_id)
+                if not _review_initialized(workflow_state):
+                    # Copy step_states from test data
+                    step_states = load_test_state()
+
+                    # Set up review state with defaults
+                    review_defaults = {
+                        "focused_index": 0,
+                        "visible_count": DEFAULT_VISIBLE_COUNT,
+                        "is_auto_mode": False,
+                        "card_width": DEFAULT_CARD_WIDTH,
+                        "playback_speed": 1.0,
+                        "auto_navigate": False,
+                        "_initialized": True,
+                    }
+                    step_states.setdefault("review", {}).update(review_defaults)
+                    workflow_state["step_states"] = step_states
+
+                    # Only the step_states subtree is written; other keys stay untouched in SQLite
+                    state_store.set_state_value(workflow_id, session_id, "step_states", step_states)
 
         # Load context and render
         ctx = _load_review_context(state_store, workflow_id, session_id)
         assembled = _get_assembled_segments(ctx)
+        total_dur = math.fsum(map(attrgetter("vad_chunk.duration"), assembled))
 
         # Build audio URLs from media_paths
         audio_urls = []
         if urls.audio_src and ctx.media_paths:
-            audio_urls = [f"{urls.audio_src}?path={mp}" for mp in ctx.media_paths]
+            audio_urls = [_audio_src_url(urls.audio_src, mp) for mp in ctx.media_paths]
         elif urls.audio_src and ctx.media_path:
-            audio_urls = [f"{urls.audio_src}?path={ctx.media_path}"]
+            audio_urls = [_audio_src_url(urls.audio_src, ctx.media_path)]
 
         # Render main content (keyboard system is managed internally)
         content = render_review_content(
@@ -230,49 +720,22 @@ def create_demo_init_handler(
             card_width=ctx.card_width,
         )
 
-        # OOB updates for chrome.
+        # OOB updates for chrome, serialized together into one HTML string.
         # Settings trigger now lives in the V2 header band's trailing slot (G3-canonical
         # placement) \u2014 OOB-swapped into DemoHtmlIds.SETTINGS_TRIGGER, not the toolbar.
         # The toolbar slot carries only the review toolbar (title input + audio controls).
-        settings_trigger_oob = Div(
-            settings_trigger,
-            id=DemoHtmlIds.SETTINGS_TRIGGER,
-            hx_swap_oob="innerHTML"
-        )
-
-        toolbar_oob = Div(
-            render_review_toolbar(
-                playback_speed=ctx.playback_speed,
-                auto_navigate=ctx.auto_navigate,
-                urls=urls,
-            ),
-            id=DemoHtmlIds.SHARED_TOOLBAR,
-            hx_swap_oob="innerHTML"
+        # Order matches _OOB_SLOT_IDS.
+        slot_html = (
+            to_xml(settings_trigger),
+            toolbar_html(ctx.playback_speed, ctx.auto_navigate),
+            to_xml(settings_modal),
+            to_xml(render_review_footer(assembled, ctx.focused_index)),
         )
+        # The main content goes into the same body, so FastHTML has no response
+        # tuple to walk; htmx still applies each top-level hx-swap-oob element
+        body = _render_init_body(slot_html, len(assembled), total_dur, content_html=to_xml(content))
 
-        settings_modal_oob = Div(
-            settings_modal,
-            id=DemoHtmlIds.SETTINGS_MODAL,
-            hx_swap_oob="innerHTML"
-        )
-
-        footer_oob = Div(
-            render_review_footer(assembled, ctx.focused_index),
-            id=DemoHtmlIds.SHARED_FOOTER,
-            hx_swap_oob="innerHTML"
-        )
-
-        # Mini-stats badge
-        total = len(assembled)
-        total_dur = sum(a.vad_chunk.duration for a in assembled)
-        mini_stats_oob = Span(
-            f"{total} segments \u00b7 {total_dur:.1f}s",
-            id=DemoHtmlIds.MINI_STATS,
-            cls=combine_classes(badge, badge_styles.ghost, badge_sizes.sm),
-            hx_swap_oob="true",
-        )
-
-        return (content, settings_trigger_oob, toolbar_oob, settings_modal_oob, footer_oob, mini_stats_oob)
+        return HTMLResponse(body)
 
     return init_handler
 
@@ -281,6 +744,35 @@ def create_demo_init_handler(
 # Demo Page Renderer
 # =============================================================================
 
+# Full-page variants cached for "/" (one per distinct URL, plus the fragment)
+PAGE_HTML_CACHE_SIZE = 32
+
+# FastHTML's own Vary header for responses that switch on HX-Request
+PAGE_RESPONSE_HEADERS = {"vary": "HX-Request, HX-History-Restore-Request"}
+
+
+def _is_htmx_swap(request) -> bool:  # True if the page should be sent as a bare fragment
+    """Check for an HTMX request that swaps content (history restores need the full page)."""
+    return "hx-request" in request.headers and "hx-history-restore-request" not in request.headers
+
+
+def _render_index_html(
+    request,  # FastHTML request (carries the app's hdrs, ftrs, bodykw and htmlkw)
+    content:Any,  # Page content component
+    fragment:bool,  # Send the content without the page shell
+) -> str:  # Serialized response body
+    """Serialize the page as FastHTML would for an FT return, using its public respond() for the shell."""
+    if fragment:
+        return to_xml(content)
+    # Mirrors the shell FastHTML's private _xt_cts adds to full-page FT returns:
+    # the app title plus its https canonical link, honouring a request override
+    heads = [Title(request.app.title)]
+    if request.app.canonical:
+        url = str(getattr(request, "canonical", request.url)).replace("http://", "https://", 1)
+        heads.append(Link(rel="canonical", href=url))
+    return to_xml(respond(request, heads, (content,)))
+
+
 def render_demo_page(
     urls: ReviewUrls,
     init_url: str,
@@ -292,24 +784,10 @@ def render_demo_page(
 
         # Column header
         header = Div(
-            Span(
-                "Review",
-                cls=combine_classes(
-                    font_size.sm, font_weight.bold,
-                    uppercase, tracking.wide,
-                    text_tiers.muted
-                )
-            ),
-            Span(
-                "--",
-                id=DemoHtmlIds.MINI_STATS,
-                cls=combine_classes(badge, badge_styles.ghost, badge_sizes.sm)
-            ),
+            Span("Review", cls=_COLUMN_TITLE_CLS),
+            Span("--", id=DemoHtmlIds.MINI_STATS, cls=_BADGE_MINI_CLS),
             id=DemoHtmlIds.COLUMN_HEADER,
-            cls=combine_classes(
-                flex_display, justify.between, items.center,
-                chrome.column_header,
-            )
+            cls=_COLUMN_HEADER_CLS
         )
 
         # Column content (loading state with auto-trigger)
@@ -322,25 +800,15 @@ def render_demo_page(
                 hx_swap="outerHTML"
             ),
             id=ReviewHtmlIds.REVIEW_CONTENT,
-            cls=combine_classes(grow(), overflow.hidden, flex_display, flex_direction.col, p(4))
+            cls=_COLUMN_CONTENT_CLS
         )
 
         # Column
-        column_cls = combine_classes(
-            w.full, max_w._4xl, m.x.auto,
-            min_h(0),
-            flex_display, flex_direction.col,
-            panels.structural_container,
-            overflow.hidden,
-            transition.all, duration._200,
-            ring(1), "ring-primary",
-        )
-
         column = Div(
             header,
             content,
             id=DemoHtmlIds.COLUMN,
-            cls=column_cls
+            cls=_COLUMN_CLS
         )
 
         # Keyboard hints modal
@@ -356,9 +824,9 @@ def render_demo_page(
         # Placeholder chrome
         toolbar = Div(
             P("Toolbar will appear here after initialization.",
-              cls=combine_classes(font_size.sm, text_tiers.muted)),
+              cls=_PLACEHOLDER_TEXT_CLS),
             id=DemoHtmlIds.SHARED_TOOLBAR,
-            cls=str(p(2))
+            cls=_P2
         )
 
         # Settings modal container (populated by init handler)
@@ -366,12 +834,9 @@ def render_demo_page(
 
         footer = Div(
             P("Footer with progress will appear here after initialization.",
-              cls=combine_classes(font_size.sm, text_tiers.muted)),
+              cls=_PLACEHOLDER_TEXT_CLS),
             id=DemoHtmlIds.SHARED_FOOTER,
-            cls=combine_classes(
-                chrome.column_footer,
-                flex_display, justify.center, items.center,
-            )
+            cls=_FOOTER_CLS
         )
 
         # Commit button (only shown if commit URL is available)
@@ -379,8 +844,8 @@ def render_demo_page(
         if urls.commit:
             commit_button = Button(
                 lucide_icon("database", size=icons.text_button),
-                Span("Commit to Graph", cls=str(m.l(2))),
-                cls=combine_classes(btn, btn_colors.success, btn_sizes.sm, flex_display, items.center),
+                Span("Commit to Graph", cls=_ML2),
+                cls=_COMMIT_BUTTON_CLS,
                 hx_post=urls.commit,
                 hx_swap="none",
             )
@@ -420,14 +885,7 @@ def render_demo_page(
             # Content area
             Div(
                 column,
-                cls=combine_classes(
-                    grow(),
-                    min_h(0),
-                    flex_display,
-                    flex_direction.col,
-                    overflow.hidden,
-                    p(1),
-                )
+                cls=_CONTENT_AREA_CLS
             ),
 
             # Footer
@@ -441,17 +899,53 @@ def render_demo_page(
             hints_script,
 
             id=DemoHtmlIds.CONTAINER,
-            cls=combine_classes(
-                container, max_w._5xl, m.x.auto,
-                h.full,
-                flex_display, flex_direction.col,
-                p(4), p.x(2), p.b(0)
-            )
+            cls=_CONTAINER_CLS
         )
 
     return page_content
 
 
+# =============================================================================
+# Lazy Graph Service
+# =============================================================================
+
+class LazyGraphService(GraphService):
+    """Graph service that loads its plugin on the first commit instead of at startup."""
+
+    def __init__(
+        self,
+        plugin_manager:PluginManager,  # Plugin manager holding the discovered plugin
+        plugin_name:str,  # Name of the graph plugin
+        config:Optional[Dict[str, Any]]=None,  # Plugin configuration for the deferred load
+    ):
+        super().__init__(plugin_manager, plugin_name)
+        self._config = config
+        self._load_attempted = False
+        self._load_lock = asyncio.Lock()
+
+    def is_available(self) -> bool:  # True until a load attempt has failed
+        """Report the plugin as available until its deferred load has been tried."""
+        return not self._load_attempted or super().is_available()
+
+    async def _ensure_loaded_async(self) -> None:
+        """Load the plugin in a worker thread on first use, raising if it fails."""
+        async with self._load_lock:
+            if not self._load_attempted:
+                meta = self._manager.get_discovered_meta(self._plugin_name)
+                try:
+                    success = meta is not None and await self._manager.load_plugin_async(meta, self._config)
+                finally:
+                    self._load_attempted = True
+                print(f"  {self._plugin_name}: {'loaded' if success else 'failed'}")
+        if not super().is_available():
+            raise RuntimeError(f"Plugin {self._plugin_name} failed to load")
+
+    async def commit_document_async(self, *args, **kwargs) -> Dict[str, Any]:
+        """Load the plugin if needed, then commit the document."""
+        await self._ensure_loaded_async()
+        return await super().commit_document_async(*args, **kwargs)
+
+
 # =============================================================================
 # Main Application
 # =============================================================================
@@ -466,6 +960,7 @@ def main():
     APP_ID = "txreview"
 
     app, rt = fast_app(
+        debug=False,
         pico=False,
         hdrs=[*get_daisyui_headers(), create_theme_persistence_script()],
         title="Review Demo",
@@ -483,7 +978,7 @@ def main():
     # Set up state store
     # -------------------------------------------------------------------------
     temp_db = Path(tempfile.gettempdir()) / "cjm_transcript_review_demo_state.db"
-    state_store = SQLiteWorkflowStateStore(temp_db)
+    state_store = PooledStateStore(temp_db)
     workflow_id = "review-demo"
 
     print(f"  State store: {temp_db}")
@@ -504,40 +999,28 @@ def main():
     )
     plugin_manager.discover_manifests()
 
-    # Load the graph plugin
+    # The graph plugin is only needed for commits, so it loads on the first
+    # commit instead of delaying startup. Commit stays hidden only when no
+    # manifest was discovered.
     graph_plugin_name = "cjm-graph-plugin-sqlite"
     graph_meta = plugin_manager.get_discovered_meta(graph_plugin_name)
     graph_service = None
 
     if graph_meta:
-        try:
-            success = plugin_manager.load_plugin(graph_meta, {
-                "db_path": graph_meta.manifest.get("db_path")
-            })
-            status = "loaded" if success else "failed"
-            print(f"  {graph_plugin_name}: {status}")
-
-            if success:
-                graph_service = GraphService(plugin_manager, graph_plugin_name)
-        except Exception as e:
-            print(f"  {graph_plugin_name}: error - {e}")
+        graph_service = LazyGraphService(
+            plugin_manager, graph_plugin_name,
+            config={"db_path": graph_meta.manifest.get("db_path")},
+        )
+        print(f"  {graph_plugin_name}: found (loads on first commit)")
     else:
         print(f"  {graph_plugin_name}: not found (commit disabled)")
 
     # -------------------------------------------------------------------------
     # Audio serving route
     # -------------------------------------------------------------------------
-    audio_router = APIRouter(prefix="/audio")
-
-    @audio_router
-    def audio_src(path: str = None):
-        """Serve audio file for Web Audio API playback."""
-        if path and Path(path).exists():
-            return FileResponse(path, media_type="audio/mpeg")
-        from fasthtml.common import Response
-        return Response(status_code=404, content="Audio file not found")
-
-    audio_src_url = audio_src.to()
+    # Class endpoints are mounted by Starlette as raw ASGI apps, so the hot
+    # audio path skips FastHTML's per-call Request and parameter handling
+    audio_src_url = AUDIO_SRC_PATH
 
     # -------------------------------------------------------------------------
     # Set up review routes
@@ -568,23 +1051,43 @@ def main():
     # -------------------------------------------------------------------------
     page_content = render_demo_page(review_urls, init_url)
 
+    # "/" is static, so the HTML FastHTML renders for it is kept per variant:
+    # the HTMX fragment, and the full page per canonical URL (embedded in its link)
+    page_html_cache: "OrderedDict[Tuple[bool, Optional[str]], str]" = OrderedDict()
+    page_html_lock = threading.Lock()
+
     @router
     def index(request, sess):
         """Demo homepage."""
-        return handle_htmx_request(request, page_content)
+        # Beforeware injections (e.g. toasts) vary per request, so FastHTML renders those
+        if getattr(request, "injects", None):
+            return page_content()
+        fragment = _is_htmx_swap(request)
+        key = (fragment, None if fragment else str(getattr(request, "canonical", request.url)))
+        html = _lru_get(
+            page_html_cache, page_html_lock, PAGE_HTML_CACHE_SIZE, key,
+            lambda: _render_index_html(request, page_content(), fragment),
+        )
+        return HTMLResponse(html, headers=PAGE_RESPONSE_HEADERS)
 
     # -------------------------------------------------------------------------
     # Register routes
     # -------------------------------------------------------------------------
-    register_routes(app, router, audio_router, init_router, *review_routers)
-
-    # Debug output
-    print("\n" + "=" * 70)
-    print("Registered Routes:")
-    print("=" * 70)
-    for route in app.routes:
-        if hasattr(route, 'path'):
-            print(f"  {route.path}")
+    register_routes(app, router, init_router, *review_routers)
+    app.router.routes.insert(0, Route(AUDIO_SRC_PATH, endpoint=AudioSrcEndpoint(), methods=["GET", "HEAD"]))
+
+    # Build the middleware stack now rather than on the first request. Route
+    # patterns are already compiled when each route is constructed.
+    app.middleware_stack = app.build_middleware_stack()
+
+    # Debug output (set DEBUG=1 to list registered routes)
+    if os.environ.get("DEBUG"):
+        print("\n" + "=" * 70)
+        print("Registered Routes:")
+        print("=" * 70)
+        for route in app.routes:
+            if hasattr(route, 'path'):
+                print(f"  {route.path}")
     print("=" * 70)
     print("Demo App Ready!")
     print("=" * 70 + "\n")
@@ -593,9 +1096,9 @@ def main():
 
 
 if __name__ == "__main__":
+    import importlib.util
     import uvicorn
     import webbrowser
-    import threading
 
     app = main()
 
@@ -618,8 +1121,19 @@ if __name__ == "__main__":
     print("  Auto toggle       - Auto-advance to next segment on completion")
     print()
 
-    timer = threading.Timer(1.5, lambda: webbrowser.open(f"http://localhost:{port}"))
-    timer.daemon = True
-    timer.start()
-
-    uvicorn.run(app, host=host, port=port)
+    @app.on_event("startup")
+    async def open_browser():
+        """Open the demo in a browser shortly after the server starts."""
+        # webbrowser.open can block for seconds, so it runs on the default executor
+        loop = asyncio.get_running_loop()
+        loop.call_later(1.5, loop.run_in_executor, None, webbrowser.open, f"http://localhost:{port}")
+
+    # uvloop event loop + httptools parser when installed (uvicorn[standard])
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+    # No per-request access log lines on the keyboard-navigation hot path
+    uvicorn.run(
+        app, host=host, port=port, loop=loop, http=http,
+        log_level="warning", access_log=False,
+    )